@@ -72,7 +72,7 @@ def run_vasp(
     # 4. POTCAR - resolve via potcar_config_file
     if potcar_config_file is not None:
         config = read_potcar_config(potcar_config_file)
-        pseudopot_lib_path = config["default_POTCAR_library_path"]
+        pseudopot_lib_path = config["default_POTCAR_path"]
     else:
         pseudopot_lib_path = None
 
@@ -83,6 +83,7 @@ def run_vasp(
     )
     vasp_input = VaspInput(
         structure=structure,
+        incar=incar,
         potcar_paths=potcar_paths,
         pseudopot_lib_path=pseudopot_lib_path,
         pseudopot_functional=functional,
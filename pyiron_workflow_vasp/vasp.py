@@ -1,22 +1,16 @@
 from __future__ import annotations
 
+import io
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-import shutil
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass, field
 
-import pandas as pd
-
-from pymatgen.core import Structure
-from pymatgen.io.vasp.inputs import Incar, Kpoints
-from pymatgen.io.vasp.outputs import Vasprun
-from pymatgen.io.ase import AseAtomsAdaptor
-
-from pyiron_vasp.vasp.output import parse_vasp_output as pyiron_atomistics_pvo
-
 from ase import Atoms
 
 from pyiron_workflow import Workflow
@@ -25,6 +19,16 @@ from pyiron_workflow_vasp.generic import delete_files_recursively, compress_dire
 
 from pyiron_snippets.logger import logger
 
+# pandas, pymatgen and pyiron_vasp are slow to import and only needed once a
+# job is actually set up or parsed, so they are imported where they are used.
+# The names below exist for static type checkers only: typing.get_type_hints
+# can't resolve the annotations that use them (VaspInput, write_INCAR,
+# write_KPOINTS, get_default_POTCAR_paths), so keep them out of node
+# signatures, whose hints pyiron_workflow resolves at runtime.
+if TYPE_CHECKING:
+    import pandas as pd
+    from pymatgen.io.vasp.inputs import Incar, Kpoints
+
 # Default location of the user config — overridable via env var to ease testing / CI.
 DEFAULT_CONFIG_PATH = Path(
     os.environ.get("PYIRON_VASP_CONFIG", Path.home() / ".pyiron_vasp_config")
@@ -34,6 +38,9 @@ def read_potcar_config(config_file: Path) -> dict:
     """
     Reads the POTCAR configuration from a file and resolves the paths dynamically based on config content.
 
+    The parsed configuration is cached per file and reused until the file's
+    modification time or size changes.
+
     Args:
         config_file (Path): Path to the configuration file.
 
@@ -47,26 +54,32 @@ def read_potcar_config(config_file: Path) -> dict:
         FileNotFoundError: If the configuration file does not exist.
         Exception: For any other unexpected issues encountered while reading the file.
     """
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {config_file}") from e
+    except Exception as e:
+        raise Exception(f"Error reading configuration file: {e}") from e
+    # Hand out a copy so callers can't modify the cached entry
+    return dict(
+        _read_potcar_config_cached(os.fspath(config_file), st.st_mtime_ns, st.st_size)
+    )
 
-    config_data = {}
 
+@lru_cache(maxsize=8)
+def _read_potcar_config_cached(config_file: str, mtime_ns: int, size: int) -> dict:
+    # ``mtime_ns`` and ``size`` are only part of the cache key, so an edited
+    # config file is parsed afresh
     # Read the configuration file
     try:
-        with open(config_file, "r") as f:
-            for line in f:
-                # Skip comments and empty lines
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-
-                # Split the line into key and value
-                if "=" in line:
-                    key, value = line.split("=", 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Store the configuration
-                    config_data[key] = value
+        text = Path(config_file).read_text()
+        # Split each "key = value" line on its first "=", skipping comments,
+        # empty lines and lines without an "="
+        config_data = {
+            key.strip(): value.strip()
+            for key, sep, value in (line.strip().partition("=") for line in text.splitlines())
+            if sep and not key.startswith("#")
+        }
 
         # Resolve the pyiron_vasp_resources path
         pyiron_vasp_resources = config_data.get("pyiron_vasp_resources", "")
@@ -140,9 +153,14 @@ def _default_functional() -> str:
     return _get_potcar_config()["default_functional"]
 
 
+def _potcar_root(pseudopot_lib_path: str, pseudopot_functional: str) -> str:
+    """Directory holding one functional's POTCARs inside a POTCAR library."""
+    return os.path.join(pseudopot_lib_path, pseudopot_functional)
+
+
 def _default_POTCAR_generation_path() -> str:
     cfg = _get_potcar_config()
-    return os.path.join(cfg["default_POTCAR_path"], cfg["default_functional"])
+    return _potcar_root(cfg["default_POTCAR_path"], cfg["default_functional"])
 
 
 def _default_POTCAR_specification_csv() -> str:
@@ -205,19 +223,71 @@ class VaspInput:
 #     kpoints=[]
 #     plane_wave_cutoff=[]
 
+# Input files are tiny, so each is rendered in memory and written in one go
+# rather than streamed through the writers of ase/pymatgen
+_DEFAULT_KPOINTS_CONTENT = "Automatic mesh\n0\nGamma\n1 1 1\n0 0 0\n"
+_DEFAULT_KPOINTS_BYTES = _DEFAULT_KPOINTS_CONTENT.encode()
+
+
 def write_POSCAR(workdir: str, structure: Atoms, filename: str = "POSCAR") -> str:
     poscar_path = os.path.join(workdir, filename)
     # structure.to(fmt="poscar", filename=poscar_path)
-    structure.write(poscar_path, format="vasp")
+    buffer = io.StringIO()
+    structure.write(buffer, format="vasp")
+    Path(poscar_path).write_text(buffer.getvalue(), encoding="utf-8")
     return poscar_path
 
 
 def write_INCAR(workdir: str, incar: Incar, filename: str = "INCAR") -> str:
     incar_path = os.path.join(workdir, filename)
-    incar.write_file(incar_path)
+    # str() renders exactly what Incar.write_file would write
+    Path(incar_path).write_text(str(incar), encoding="utf-8")
     return incar_path
 
 
+def _read_file_into(path: str, view: memoryview) -> None:
+    with open(path, "rb", buffering=0) as fd:
+        filled = 0
+        while filled < len(view):
+            n = fd.readinto(view[filled:])
+            if not n:
+                raise OSError(f"{path} changed size while being copied")
+            filled += n
+
+
+def _concatenate_files(paths: list[str], destination: str) -> None:
+    """
+    Concatenate ``paths`` into ``destination``. The sources are stat'ed and
+    read concurrently, since POTCAR libraries usually live on network
+    filesystems where per-file round trips would otherwise add up. Every
+    source is read straight into its slice of one preallocated buffer, which
+    is then written out in a single call. Paths that appear more than once
+    are only read once.
+    """
+    unique_paths = list(dict.fromkeys(paths))
+    with ThreadPoolExecutor(max_workers=max(len(unique_paths), 1)) as executor:
+        sizes = dict(zip(unique_paths, executor.map(os.path.getsize, unique_paths)))
+        offsets = {}
+        total = 0
+        for path in paths:
+            offsets.setdefault(path, []).append(total)
+            total += sizes[path]
+
+        buffer = bytearray(total)
+        view = memoryview(buffer)
+        slices = {}
+        for path in unique_paths:
+            start = offsets[path][0]
+            slices[path] = view[start : start + sizes[path]]
+        list(executor.map(_read_file_into, slices, slices.values()))
+        for path, first in slices.items():
+            for offset in offsets[path][1:]:
+                view[offset : offset + len(first)] = first
+
+    with open(destination, "wb") as f:
+        f.write(buffer)
+
+
 def write_POTCAR(workdir: str, vasp_input: VaspInput, filename: str = "POTCAR") -> str:
     class PotcarNotGeneratedError(Exception):
         pass
@@ -231,10 +301,7 @@ def write_POTCAR(workdir: str, vasp_input: VaspInput, filename: str = "POTCAR")
 
     potcar_path = os.path.join(workdir, filename)
 
-    with open(potcar_path, "wb") as wfd:
-        for f in potcar_paths:
-            with open(f, "rb") as fd:
-                shutil.copyfileobj(fd, wfd)
+    _concatenate_files(potcar_paths, potcar_path)
 
     return potcar_path
 
@@ -244,12 +311,10 @@ def write_KPOINTS(
 ) -> str:
     kpoint_path = os.path.join(workdir, filename)
     if kpoints is not None:
-        kpoints.write_file(kpoint_path)
+        Path(kpoint_path).write_text(str(kpoints), encoding="utf-8")
     else:
-        with open(kpoint_path, "w") as f:
-            f.write(
-                "Automatic mesh\n0\nGamma\n1 1 1\n0 0 0\n"
-            )  # Example KPOINTS content
+        with open(kpoint_path, "wb") as f:
+            f.write(_DEFAULT_KPOINTS_BYTES)
     return kpoint_path
 
 
@@ -265,14 +330,17 @@ def create_WorkingDirectory(workdir: str, quiet: bool = False) -> str:
     Returns:
         str: Path to the created or existing directory.
     """
-    # Check if workdir exists
-    if not os.path.exists(workdir):
+    # Try to create it straight away rather than checking for it first
+    try:
         os.makedirs(workdir)
         logger.info(f"made directory '{workdir}'")
-    else:
-        warnings.warn(
-            f"Directory '{workdir}' already exists. Existing files may be overwritten."
-        )
+    except FileExistsError:
+        if not os.path.isdir(workdir):
+            raise
+        if not quiet:
+            warnings.warn(
+                f"Directory '{workdir}' already exists. Existing files may be overwritten."
+            )
     return workdir
 
 
@@ -288,17 +356,96 @@ def write_VaspInputSet(workdir: str, vasp_input: VaspInput) -> str:
     Returns:
         str: Path to the working directory.
     """
-    _ = write_POSCAR(workdir=workdir, structure=vasp_input.structure)
-    _ = write_INCAR(workdir=workdir, incar=vasp_input.incar)
-    _ = write_POTCAR(workdir=workdir, vasp_input=vasp_input)
-    if vasp_input.kpoints is not None:
-        _ = write_KPOINTS(workdir=workdir, kpoints=vasp_input.kpoints)
+    # The files are independent, so write them concurrently; on shared cluster
+    # filesystems the per-file create/write/close latency then overlaps
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(write_POSCAR, workdir=workdir, structure=vasp_input.structure),
+            executor.submit(write_INCAR, workdir=workdir, incar=vasp_input.incar),
+            executor.submit(write_POTCAR, workdir=workdir, vasp_input=vasp_input),
+        ]
+        if vasp_input.kpoints is not None:
+            futures.append(
+                executor.submit(write_KPOINTS, workdir=workdir, kpoints=vasp_input.kpoints)
+            )
+    # Surface the first failure, if any
+    for future in futures:
+        future.result()
 
     return workdir
 
 
+_PARSED_OUTPUT_CACHE = ".parsed_output.pkl"
+# Every file parse_vasp_output reads: the structures come from POSCAR/CONTCAR,
+# the charge density from CHGCAR and the Bader charges from the AECCAR files
+_PARSED_OUTPUT_SOURCES = (
+    "vasprun.xml",
+    "OUTCAR",
+    "CHGCAR",
+    "CONTCAR",
+    "POSCAR",
+    "AECCAR0",
+    "AECCAR2",
+)
+
+
+def _parsed_output_key(workdir: str) -> Optional[tuple]:
+    """
+    Key identifying the current output of ``workdir``: the parser version and
+    the modification time and size of the files it reads. ``None`` if there is
+    nothing to parse.
+    """
+    import pyiron_vasp
+
+    stats = []
+    for name in _PARSED_OUTPUT_SOURCES:
+        try:
+            st = os.stat(os.path.join(workdir, name))
+        except OSError:
+            continue
+        stats.append((name, st.st_mtime_ns, st.st_size))
+    if not stats:
+        return None
+    return (getattr(pyiron_vasp, "__version__", None), tuple(stats))
+
+
+def _load_parsed_output(workdir: str, key: Optional[tuple]):
+    if key is None:
+        return None
+    try:
+        with open(os.path.join(workdir, _PARSED_OUTPUT_CACHE), "rb") as f:
+            cached = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # A truncated or incompatible cache just means parsing again
+        logger.debug(f"Ignoring unreadable parse cache in '{workdir}': {e}")
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached.get("data")
+
+
+def _store_parsed_output(workdir: str, key: Optional[tuple], data) -> None:
+    if key is None or data is None:
+        return
+    cache_path = os.path.join(workdir, _PARSED_OUTPUT_CACHE)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"key": key, "data": data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomic, so concurrent readers never see a partially written cache
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug(f"Could not write parse cache in '{workdir}': {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 @Workflow.wrap.as_function_node("output_dict")
-def parse_VaspOutput(workdir, function=None, parser_args=None):
+def parse_VaspOutput(workdir, function=None, parser_args=None, cache_parsed_output=False):
     """
     Parse VASP output files in the working directory.
 
@@ -309,18 +456,46 @@ def parse_VaspOutput(workdir, function=None, parser_args=None):
             ``parser_args`` is overridden with ``{"working_directory": workdir}``.
         parser_args (dict, optional): Keyword arguments to pass to ``function``.
             Ignored when ``function`` is ``None``.
+        cache_parsed_output (bool, optional): With the default parser, pickle
+            the result to ``.parsed_output.pkl`` in ``workdir`` and reuse it
+            while vasprun.xml/OUTCAR and the parser version are unchanged.
+            The cache is unpickled, so only enable this for directories
+            nobody else can write to. Defaults to False.
 
     Returns:
         dict: Dictionary containing parsed VASP output data.
     """
     if function is None:
         from pyiron_vasp.vasp.output import parse_vasp_output as parse_vasp_directory
-        parser_args = {"working_directory": workdir}
+        # The default parser's result only depends on the output files, so it
+        # can be cached next to them and reused until they (or the parser) change
+        cache_key = _parsed_output_key(workdir) if cache_parsed_output else None
+        output = _load_parsed_output(workdir, cache_key)
+        if output is None:
+            output = parse_vasp_directory(working_directory=workdir)
+            _store_parsed_output(workdir, cache_key, output)
     else:
         parse_vasp_directory = function
         if parser_args is None:
             parser_args = {}
-    return parse_vasp_directory(**parser_args)
+        output = parse_vasp_directory(**parser_args)
+    return output
+
+
+def _log_contains(filepath: str, text: str, tail_bytes: int = 65536) -> bool:
+    """
+    Check whether ``text`` occurs in the log at ``filepath``, reading only its
+    last ``tail_bytes`` first. VASP's final status lines sit at the end of the
+    log, so the whole file is only searched when the tail doesn't have it.
+    """
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - tail_bytes))
+        if text.encode() in f.read():
+            return True
+    return size > tail_bytes and isLineInFile.node_function(
+        filepath=filepath, line=text, exact_match=False
+    )
 
 
 @Workflow.wrap.as_function_node("convergence")
@@ -347,23 +522,26 @@ def check_convergence(
         "reached required accuracy - stopping structural energy minimisation"
     )
 
-    # Try vasprun.xml first (authoritative), fall back to scanning the run log
-    # and finally the backup log captured by the queueing system.
-    try:
-        vr = Vasprun(filename=os.path.join(workdir, filename_vasprun))
-        converged = vr.converged
-    except Exception:
-        for logname in (filename_vasplog, backup_vasplog):
-            try:
-                converged = isLineInFile.node_function(
-                    filepath=os.path.join(workdir, logname),
-                    line=line_converged,
-                    exact_match=False,
-                )
-                if converged:
-                    break
-            except Exception:
-                continue
+    # Scan the run log and then the backup log captured by the queueing system
+    # first: a text search is far cheaper than parsing vasprun.xml. Only if
+    # neither reports convergence fall back to vasprun.xml (which also covers
+    # static runs, whose logs never print the line above).
+    for logname in (filename_vasplog, backup_vasplog):
+        try:
+            converged = _log_contains(os.path.join(workdir, logname), line_converged)
+            if converged:
+                break
+        except Exception:
+            continue
+
+    if not converged:
+        from pymatgen.io.vasp.outputs import Vasprun
+
+        try:
+            vr = Vasprun(filename=os.path.join(workdir, filename_vasprun))
+            converged = vr.converged
+        except Exception:
+            pass
 
     return converged
 
@@ -380,6 +558,7 @@ def vasp_job(
     remove_calc_dir: bool = False,
     vasp_parser_function=None,
     vasp_parser_args: Optional[dict] = None,
+    cache_parsed_output: bool = False,
 ):
     """
     Run a VASP calculation with the specified input parameters.
@@ -400,6 +579,8 @@ def vasp_job(
                                                  that takes a workdir parameter and returns parsed output. If None, the
                                                  default parse_VaspOutput function will be used.
         vasp_parser_args (dict, optional): Additional arguments to pass to the vasp_parser_function. Defaults to {}.
+        cache_parsed_output (bool, optional): Whether the default parser caches its result in the working directory
+                                              (see parse_VaspOutput). The cache is never compressed. Defaults to False.
     
     Returns:
         tuple: (vasp_output, convergence_status)
@@ -411,10 +592,10 @@ def vasp_job(
     self.working_dir = create_WorkingDirectory(workdir=workdir)
     self.vaspwriter = write_VaspInputSet(workdir=workdir, vasp_input=vasp_input)
     self.job = shell(command=command, workdir=workdir)
-    self.vasp_output = parse_VaspOutput(workdir=workdir, function=vasp_parser_function, parser_args=vasp_parser_args)
+    self.vasp_output = parse_VaspOutput(workdir=workdir, function=vasp_parser_function, parser_args=vasp_parser_args, cache_parsed_output=cache_parsed_output)
     self.convergence_status = check_convergence(workdir=workdir)
     self.cleanup = delete_files_recursively(workdir=workdir, files_to_be_deleted=files_to_be_deleted)
-    self.compress_operation = compress_directory(directory_path=workdir, actually_compress=compress, inside_dir=compressed_file_in_dir)
+    self.compress_operation = compress_directory(directory_path=workdir, exclude_files=[_PARSED_OUTPUT_CACHE], actually_compress=compress, inside_dir=compressed_file_in_dir)
     self.remove_dir = remove_dir(directory_path=workdir, actually_remove=remove_calc_dir)
     (
         self.working_dir
@@ -433,45 +614,65 @@ def vasp_job(
 
 
 def stack_element_string(structure) -> tuple[list[str], list[int]]:
-    #site_element_list = [site.species_string for site in structure]
-    site_element_list = [atom.symbol for atom in structure]
-    past_element = site_element_list[0]
-    element_list = [past_element]
-    element_count = []
-    count = 0
-
-    for element in site_element_list:
-        if element == past_element:
-            count += 1
-        else:
-            element_count.append(count)
-            element_list.append(element)
-            count = 1
-            past_element = element
-
-    element_count.append(count)
+    # Run-length encode the chemical symbols, e.g. Fe Fe O Fe -> [Fe, O, Fe], [2, 1, 1]
+    groups = [
+        (element, sum(1 for _ in run))
+        for element, run in groupby(structure.get_chemical_symbols())
+    ]
+    element_list = [element for element, _ in groups]
+    element_count = [count for _, count in groups]
     return element_list, element_count
 
 
+def _default_potcar_names(potcar_df: pd.DataFrame) -> dict[str, str]:
+    """Map each element symbol to its default potential name (first default row wins)."""
+    defaults = potcar_df[potcar_df["default"] == True].drop_duplicates("symbol")
+    return dict(zip(defaults["symbol"], defaults["potential_name"]))
+
+
+def _potcar_paths_from_names(
+    symbols, potcar_root: str, default_potcar_names: dict[str, str]
+) -> list[str]:
+    # The potential names are bare directory names, so plain concatenation
+    # onto the already-joined root is enough
+    return [f"{potcar_root}{os.sep}{default_potcar_names[element]}{os.sep}POTCAR" for element in symbols]
+
+
+@lru_cache(maxsize=4)
+def _load_default_potcar_names(potcar_csv: str) -> dict[str, str]:
+    """
+    Read a pseudopotential specification table once per CSV path and reduce it
+    to the default potential of each symbol, so lookups never scan the table.
+    """
+    import pandas as pd
+
+    potcar_df = pd.read_csv(potcar_csv, usecols=["potential_name", "symbol", "default"])
+    return _default_potcar_names(potcar_df)
+
+
+@lru_cache(maxsize=256)
+def _resolve_potcar_paths(
+    symbols: tuple[str, ...], potcar_root: str, potcar_csv: str
+) -> tuple[str, ...]:
+    """Resolve (and memoise) the default POTCAR paths for a species sequence."""
+    return tuple(_potcar_paths_from_names(symbols, potcar_root, _load_default_potcar_names(potcar_csv)))
+
+
 def get_default_POTCAR_paths(
     structure: Atoms,
     pseudopot_lib_path: str,
     pseudopot_functional: str = "GGA",
     potcar_df: Optional[pd.DataFrame] = None,
 ) -> list[str]:
-    if potcar_df is None:
-        potcar_df = pd.read_csv(_default_POTCAR_specification_csv())
     ele_list, _ = stack_element_string(structure)
-    potcar_paths = []
-    for element in ele_list:
-        ele_default_potcar_path = potcar_df[
-            (potcar_df["symbol"] == element) & (potcar_df["default"] == True)
-        ].potential_name.values[0]
-        potcar_paths.append(
-            os.path.join(pseudopot_lib_path, pseudopot_functional, ele_default_potcar_path, "POTCAR")
+    potcar_root = _potcar_root(pseudopot_lib_path, pseudopot_functional)
+    if potcar_df is None:
+        # Batch workflows resolve the same species and library over and over;
+        # only an explicitly passed (unhashable) table bypasses the cache
+        return list(
+            _resolve_potcar_paths(tuple(ele_list), potcar_root, _default_POTCAR_specification_csv())
         )
-
-    return potcar_paths
+    return _potcar_paths_from_names(ele_list, potcar_root, _default_potcar_names(potcar_df))
 
 
 #%% These are utilities 
@@ -479,7 +680,6 @@ def get_default_POTCAR_paths(
 def generate_VaspInput(structure,
                        incar,
                        potcar_paths):
-    print(type(structure))
     vaspinput = VaspInput(structure, incar, potcar_paths=potcar_paths)
     return vaspinput
     
@@ -539,14 +739,25 @@ def generate_modified_incar(incar, modifications):
     for key, value in modifications.items():
         modified_incar[key] = value
 
+    from pymatgen.io.vasp.inputs import Incar
+
     return Incar.from_dict(modified_incar)
 
+@lru_cache(maxsize=64)
+def _atoms_from_structure_json(structure_json: str) -> Atoms:
+    """Convert a pymatgen structure JSON string to ase Atoms, memoised on the string."""
+    from pymatgen.core import Structure
+    from pymatgen.io.ase import AseAtomsAdaptor
+
+    return AseAtomsAdaptor.get_atoms(Structure.from_str(structure_json, fmt="json"))
+
+
 @Workflow.wrap.as_function_node("VaspInput")
 def construct_sequential_VaspInput_from_vaspoutput_structure(vasp_output,
                                             incar,
                                             potcar_paths):
-    
-    vi = VaspInput(AseAtomsAdaptor.get_atoms(Structure.from_str(vasp_output.structures.iloc[0][-1], fmt="json")),
+    # Hand out a copy so the cached Atoms can't be modified downstream
+    vi = VaspInput(_atoms_from_structure_json(vasp_output.structures.iloc[0][-1]).copy(),
                    incar,
                    potcar_paths=potcar_paths)
     return vi
@@ -0,0 +1,437 @@
+"""Unit tests for the file and process helpers in generic.py.
+
+Written as ``unittest.TestCase`` subclasses so the pyiron shared CI
+(which runs ``unittest discover``) picks them up. Pytest also runs
+them via its unittest compatibility layer.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import errno
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import zstandard
+except ImportError:  # optional extra
+    zstandard = None
+
+
+@contextlib.contextmanager
+def _captured_fd_output():
+    """Capture everything written to the stdout/stderr file descriptors."""
+    captured = {}
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        saved = os.dup(1), os.dup(2)
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            yield captured
+        finally:
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+            out.seek(0)
+            err.seek(0)
+            captured["stdout"] = out.read()
+            captured["stderr"] = err.read()
+
+
+class _TempDirTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+
+class TestDeleteFilesRecursively(_TempDirTestCase):
+    def test_removes_only_named_files(self) -> None:
+        from pyiron_workflow_vasp.generic import delete_files_recursively
+
+        (self.tmp_path / "sub" / "deeper").mkdir(parents=True)
+        for rel in (
+            "WAVECAR",
+            "OUTCAR",
+            "sub/WAVECAR",
+            "sub/deeper/CHGCAR",
+            "sub/deeper/INCAR",
+        ):
+            (self.tmp_path / rel).write_text("x")
+
+        delete_files_recursively.node_function(
+            workdir=str(self.tmp_path), files_to_be_deleted=["WAVECAR", "CHGCAR"]
+        )
+
+        remaining = sorted(
+            str(p.relative_to(self.tmp_path))
+            for p in self.tmp_path.rglob("*")
+            if p.is_file()
+        )
+        self.assertEqual(remaining, ["OUTCAR", "sub/deeper/INCAR"])
+
+    def test_many_subdirectories(self) -> None:
+        """Enough subdirectories to take the thread-pool path."""
+        from pyiron_workflow_vasp.generic import delete_files_recursively
+
+        for i in range(8):
+            sub = self.tmp_path / f"step_{i}" / "nested"
+            sub.mkdir(parents=True)
+            (sub / "WAVECAR").write_text("x")
+            (sub.parent / "OUTCAR").write_text("x")
+
+        delete_files_recursively.node_function(
+            workdir=str(self.tmp_path), files_to_be_deleted=["WAVECAR"]
+        )
+
+        self.assertEqual(list(self.tmp_path.rglob("WAVECAR")), [])
+        self.assertEqual(len(list(self.tmp_path.rglob("OUTCAR"))), 8)
+
+
+class TestCompressDirectory(_TempDirTestCase):
+    def test_roundtrip(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        calc = self.tmp_path / "calc"
+        (calc / "sub").mkdir(parents=True)
+        (calc / "OUTCAR").write_text("outcar")
+        (calc / "vasp.log").write_text("log")
+        (calc / "sub" / "POSCAR").write_text("poscar")
+        (calc / "skip_me").write_text("nope")
+
+        output = compress_directory.node_function(
+            directory_path=str(calc),
+            exclude_files=["skip_me"],
+            exclude_file_patterns=["*.log"],
+        )
+
+        self.assertEqual(output, str(calc / "calc.tar.gz"))
+        with tarfile.open(output) as tar:
+            names = sorted(tar.getnames())
+            self.assertEqual(tar.extractfile("calc/sub/POSCAR").read(), b"poscar")
+        self.assertEqual(names, ["calc/OUTCAR", "calc/sub/POSCAR"])
+
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_zstd(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        calc = self.tmp_path / "calc"
+        calc.mkdir()
+        (calc / "OUTCAR").write_text("outcar")
+
+        output = compress_directory.node_function(
+            directory_path=str(calc), inside_dir=False, compression="zst"
+        )
+
+        self.assertEqual(output, str(self.tmp_path / "calc.tar.zst"))
+        with open(output, "rb") as f:
+            data = zstandard.ZstdDecompressor().stream_reader(f).read()
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            self.assertEqual(tar.extractfile("calc/OUTCAR").read(), b"outcar")
+
+    def test_rejects_unknown_compression(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        with self.assertRaisesRegex(ValueError, "compression"):
+            compress_directory.node_function(
+                directory_path=str(self.tmp_path), compression="xz"
+            )
+
+    def test_trailing_separator(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        calc = self.tmp_path / "calc"
+        (calc / "sub").mkdir(parents=True)
+        (calc / "sub" / "OUTCAR").write_text("outcar")
+
+        output = compress_directory.node_function(directory_path=str(calc) + os.sep)
+
+        self.assertEqual(output, str(calc / "calc.tar.gz"))
+        with tarfile.open(output) as tar:
+            self.assertEqual(tar.getnames(), ["calc/sub/OUTCAR"])
+
+    def test_accepts_pathlib_path(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        calc = self.tmp_path / "calc"
+        calc.mkdir()
+        (calc / "OUTCAR").write_text("outcar")
+
+        output = compress_directory.node_function(directory_path=calc)
+
+        self.assertEqual(output, str(calc / "calc.tar.gz"))
+        with tarfile.open(output) as tar:
+            self.assertEqual(tar.getnames(), ["calc/OUTCAR"])
+
+    def test_keeps_member_metadata(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        calc = self.tmp_path / "calc"
+        calc.mkdir()
+        outcar = calc / "OUTCAR"
+        outcar.write_text("outcar")
+        os.utime(outcar, (1_700_000_000.5, 1_700_000_000.5))
+        os.link(outcar, calc / "OUTCAR.link")
+        with tarfile.open(self.tmp_path / "reference.tar", "w") as ref:
+            expected = ref.gettarinfo(str(outcar), arcname="calc/OUTCAR")
+
+        output = compress_directory.node_function(directory_path=str(calc))
+
+        with tarfile.open(output) as tar:
+            members = {m.name: m for m in tar.getmembers()}
+        regular = [m for m in members.values() if m.isreg()]
+        links = [m for m in members.values() if m.islnk()]
+        self.assertEqual(len(regular), 1)
+        self.assertEqual(len(links), 1)
+        member, link = regular[0], links[0]
+        self.assertEqual(
+            (member.uname, member.gname, member.uid, member.gid),
+            (expected.uname, expected.gname, expected.uid, expected.gid),
+        )
+        self.assertEqual(member.mtime, expected.mtime)
+        self.assertEqual(link.linkname, member.name)
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "posix_fadvise is not available")
+    def test_page_cache_advice_is_best_effort(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        real_fadvise = os.posix_fadvise
+
+        def refuse_dontneed(fd, offset, length, advice):
+            if advice == os.POSIX_FADV_DONTNEED:
+                raise OSError(errno.EINVAL, "Invalid argument")
+            real_fadvise(fd, offset, length, advice)
+
+        calc = self.tmp_path / "calc"
+        calc.mkdir()
+        (calc / "OUTCAR").write_text("outcar")
+
+        with (
+            mock.patch.object(os, "posix_fadvise", refuse_dontneed),
+            mock.patch.object(os, "fdatasync") as fdatasync,
+        ):
+            output = compress_directory.node_function(directory_path=str(calc))
+
+        fdatasync.assert_not_called()
+        with tarfile.open(output) as tar:
+            self.assertEqual(tar.getnames(), ["calc/OUTCAR"])
+
+
+class _StubPigzTestCase(_TempDirTestCase):
+    """Puts a ``pigz`` shell script ahead of everything else on the PATH."""
+
+    def install_stub_pigz(self, body: str) -> None:
+        bin_dir = self.tmp_path / "bin"
+        bin_dir.mkdir()
+        pigz = bin_dir / "pigz"
+        pigz.write_text(f"#!/bin/sh\n{body}\n")
+        pigz.chmod(0o755)
+        path = os.pathsep.join([str(bin_dir), os.environ.get("PATH", "")])
+        patcher = mock.patch.dict(os.environ, {"PATH": path})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@unittest.skipIf(shutil.which("gzip") is None, "gzip is not installed")
+class TestCompressDirectoryWithPigz(_StubPigzTestCase):
+    def test_roundtrip_through_pigz(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        self.install_stub_pigz("exec gzip -c")
+        calc = self.tmp_path / "calc"
+        calc.mkdir()
+        data = os.urandom(3 * tarfile.BLOCKSIZE + 100)
+        (calc / "WAVECAR").write_bytes(data)
+        (calc / "OUTCAR").write_text("outcar")
+        os.symlink("OUTCAR", calc / "OUTCAR.latest")
+        os.link(calc / "WAVECAR", calc / "WAVECAR.hard")
+
+        with mock.patch.object(os, "sendfile", wraps=os.sendfile) as sendfile:
+            output = compress_directory.node_function(directory_path=str(calc))
+
+        if sys.platform.startswith("linux"):
+            self.assertTrue(sendfile.called)
+        else:
+            sendfile.assert_not_called()
+        with tarfile.open(output) as tar:
+            members = {m.name: m for m in tar.getmembers()}
+            self.assertEqual(tar.extractfile("calc/OUTCAR").read(), b"outcar")
+            self.assertTrue(members["calc/OUTCAR.latest"].issym())
+            self.assertEqual(members["calc/OUTCAR.latest"].linkname, "OUTCAR")
+            regular, hard = sorted(
+                (members["calc/WAVECAR"], members["calc/WAVECAR.hard"]),
+                key=lambda m: m.islnk(),
+            )
+            self.assertTrue(hard.islnk())
+            self.assertEqual(hard.linkname, regular.name)
+            self.assertEqual(tar.extractfile(regular).read(), data)
+
+    def test_reports_pigz_failure(self) -> None:
+        from pyiron_workflow_vasp.generic import compress_directory
+
+        # Exits without reading its input, so the tar stream hits a broken pipe
+        self.install_stub_pigz("exit 3")
+        calc = self.tmp_path / "calc"
+        calc.mkdir()
+        (calc / "WAVECAR").write_bytes(os.urandom(1024 * 1024))
+
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            compress_directory.node_function(directory_path=str(calc))
+        self.assertEqual(ctx.exception.returncode, 3)
+
+
+class TestShell(_TempDirTestCase):
+    def test_runs_plain_and_shell_syntax_commands(self) -> None:
+        from pyiron_workflow_vasp.generic import shell
+
+        plain = shell.node_function(
+            command="echo", arguments=["hello"], workdir=str(self.tmp_path)
+        )
+        self.assertEqual(plain.stdout, "hello\n")
+        self.assertEqual(plain.return_code, 0)
+
+        chained = shell.node_function(
+            command="echo $GREETING; echo done > out.txt",
+            workdir=str(self.tmp_path),
+            environment={"GREETING": "hi"},
+        )
+        self.assertEqual(chained.stdout, "hi\n")
+        self.assertEqual((self.tmp_path / "out.txt").read_text(), "done\n")
+
+    def test_runs_executable_script_without_shebang(self) -> None:
+        from pyiron_workflow_vasp.generic import shell
+
+        script = self.tmp_path / "run_vasp.sh"
+        script.write_text("echo from-script\n")
+        script.chmod(0o755)
+
+        output = shell.node_function(
+            command="./run_vasp.sh", workdir=str(self.tmp_path)
+        )
+        self.assertEqual(output.stdout, "from-script\n")
+        self.assertEqual(output.return_code, 0)
+
+    def test_output_converts_public_fields_to_dict(self) -> None:
+        from pyiron_workflow_vasp.generic import ShellOutput
+
+        output = ShellOutput(stdout="out", stderr="err", return_code=1)
+        self.assertEqual(
+            output._convert_to_dict(),
+            {
+                "stdout": "out",
+                "stderr": "err",
+                "return_code": 1,
+                "dump": None,
+                "log": None,
+            },
+        )
+        self.assertFalse(hasattr(output, "__dict__"))
+
+
+class TestIsLineInFile(_TempDirTestCase):
+    def test_exact_match_ignores_surrounding_whitespace(self) -> None:
+        from pyiron_workflow_vasp.generic import isLineInFile
+
+        f = self.tmp_path / "log.txt"
+        f.write_bytes(b"alpha beta\r\n   target line \t\r\nlast")
+
+        self.assertTrue(isLineInFile.node_function(filepath=str(f), line="target line"))
+        self.assertTrue(isLineInFile.node_function(filepath=str(f), line="last"))
+        self.assertFalse(isLineInFile.node_function(filepath=str(f), line="beta"))
+        self.assertFalse(isLineInFile.node_function(filepath=str(f), line=""))
+
+    def test_without_mmap(self) -> None:
+        """Files that can't be memory-mapped are scanned in chunks instead."""
+        import mmap
+
+        from pyiron_workflow_vasp import generic
+
+        f = self.tmp_path / "log.txt"
+        f.write_text("alpha\n  beta gamma delta\nepsilon")
+        find = generic.isLineInFile.node_function
+
+        # Tiny chunks so matches straddle chunk boundaries
+        with (
+            mock.patch.object(mmap, "mmap", side_effect=OSError("mmap not supported")),
+            mock.patch.object(generic, "_LINE_SEARCH_CHUNK_SIZE", 3),
+        ):
+            self.assertTrue(find(filepath=str(f), line="gamma d", exact_match=False))
+            self.assertTrue(find(filepath=str(f), line="beta gamma delta"))
+            self.assertTrue(find(filepath=str(f), line="epsilon"))
+            self.assertFalse(find(filepath=str(f), line="gamma"))
+
+
+class TestRemoveDir(_TempDirTestCase):
+    def test_only_when_asked(self) -> None:
+        from pyiron_workflow_vasp.generic import remove_dir
+
+        calc = self.tmp_path / "calc"
+        (calc / "sub").mkdir(parents=True)
+        (calc / "sub" / "WAVECAR").write_text("x")
+
+        remove_dir.node_function(directory_path=str(calc))
+        self.assertTrue(calc.exists())
+
+        remove_dir.node_function(directory_path=str(calc), actually_remove=True)
+        self.assertFalse(calc.exists())
+
+    def test_keeps_rm_errors_quiet(self) -> None:
+        from pyiron_workflow_vasp.generic import remove_dir
+
+        calc = self.tmp_path / "calc"
+        calc.mkdir()
+        (calc / "OUTCAR").write_text("x")
+
+        # rm refuses paths ending in "/." with a message on stderr; the failure
+        # is ignored and the fallback still clears the directory
+        with _captured_fd_output() as captured:
+            remove_dir.node_function(
+                directory_path=str(calc) + os.sep + ".", actually_remove=True
+            )
+
+        self.assertEqual(captured, {"stdout": b"", "stderr": b""})
+        self.assertFalse((calc / "OUTCAR").exists())
+
+
+class TestFileObject(_TempDirTestCase):
+    def test_is_hashable_and_immutable(self) -> None:
+        from pyiron_workflow_vasp.generic import FileObject
+
+        (self.tmp_path / "OUTCAR").write_text("x")
+        a = FileObject("OUTCAR", directory=str(self.tmp_path))
+        b = FileObject(str(self.tmp_path / "OUTCAR"))
+
+        self.assertEqual(a, b)
+        self.assertEqual(len({a, b}), 1)
+        self.assertEqual(a.path, str(self.tmp_path / "OUTCAR"))
+        self.assertEqual(a.name, "OUTCAR")
+        self.assertTrue(a.is_file)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            a._path = self.tmp_path
+
+    def test_is_file_is_rechecked_until_the_file_exists(self) -> None:
+        from pyiron_workflow_vasp.generic import FileObject
+
+        handle = FileObject("OUTCAR", directory=str(self.tmp_path))
+        self.assertIn("False", repr(handle))
+        self.assertFalse(handle.is_file)
+
+        (self.tmp_path / "OUTCAR").write_text("x")
+        self.assertTrue(handle.is_file)
+        self.assertIn("True", repr(handle))
+
+
+if __name__ == "__main__":
+    unittest.main()
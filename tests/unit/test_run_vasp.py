@@ -10,7 +10,10 @@ Written as ``unittest.TestCase`` subclasses so the pyiron shared CI
 from __future__ import annotations
 
 import inspect
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 
 class TestRunVaspSignature(unittest.TestCase):
@@ -44,5 +47,57 @@ class TestRunVaspSignature(unittest.TestCase):
         self.assertFalse(missing, msg=f"missing parameters: {missing}")
 
 
+class TestRunVaspPotcarConfig(unittest.TestCase):
+    def test_potcar_library_comes_from_potcar_config_file(self) -> None:
+        """POTCARs are taken from the library named in potcar_config_file."""
+        import pyiron_vasp.vasp.output
+        from ase.build import bulk
+        from pyiron_workflow_atomistics.engine import CalcInputStatic
+
+        from pyiron_workflow_vasp import vasp
+        from pyiron_workflow_vasp._run import run_vasp
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            config_file = root / ".pyiron_vasp_config"
+            config_file.write_text(
+                "default_POTCAR_set = potpaw64\n"
+                "default_functional = GGA\n"
+                f"pyiron_vasp_resources = {root}\n"
+                "vasp_POTCAR_path_potpaw64 = {pyiron_vasp_resources}/potpaw_64\n"
+            )
+            potcar = root / "potpaw_64" / "GGA" / "Cu" / "POTCAR"
+            potcar.parent.mkdir(parents=True)
+            potcar.write_text("Cu potential\n")
+            workdir = root / "calc"
+
+            parsed = {"generic": {"energy_pot": [-3.5]}, "converged": True}
+            with (
+                mock.patch.object(vasp, "DEFAULT_CONFIG_PATH", config_file),
+                mock.patch.object(
+                    pyiron_vasp.vasp.output, "parse_vasp_output", return_value=parsed
+                ),
+            ):
+                vasp._get_potcar_config.cache_clear()
+                try:
+                    output = run_vasp(
+                        bulk("Cu", a=3.6),
+                        working_directory=str(workdir),
+                        engine_input=CalcInputStatic(),
+                        potcar_config_file=config_file,
+                        functional="GGA",
+                        encut=400.0,
+                        kpoints_density=0.5,
+                        command="true",
+                        mode="static",
+                    )
+                finally:
+                    vasp._get_potcar_config.cache_clear()
+
+            self.assertEqual((workdir / "POTCAR").read_text(), "Cu potential\n")
+            self.assertEqual(output.final_energy, -3.5)
+            self.assertTrue(output.converged)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,329 @@
+"""Unit tests for the input-writing, POTCAR and output helpers in vasp.py.
+
+Written as ``unittest.TestCase`` subclasses so the pyiron shared CI
+(which runs ``unittest discover``) picks them up. Pytest also runs
+them via its unittest compatibility layer.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyiron_vasp.vasp.output
+from ase import Atoms
+from ase.build import bulk
+from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.io.vasp.inputs import Incar, Kpoints
+
+from pyiron_workflow_vasp import vasp
+
+
+class _VaspTestCase(unittest.TestCase):
+    """Runs each test in a scratch directory with no config file in reach."""
+
+    def setUp(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmpdir.name)
+        patcher = mock.patch.object(
+            vasp, "DEFAULT_CONFIG_PATH", self.tmp_path / "does_not_exist"
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._clear_caches()
+        self.addCleanup(self._clear_caches)
+
+    def tearDown(self) -> None:
+        self._tmpdir.cleanup()
+
+    @staticmethod
+    def _clear_caches() -> None:
+        vasp._get_potcar_config.cache_clear()
+        vasp._resolve_potcar_paths.cache_clear()
+        vasp._load_default_potcar_names.cache_clear()
+
+    def write_config(self) -> Path:
+        """Write a fake but structurally valid config file and return its path."""
+        cfg = self.tmp_path / ".pyiron_vasp_config"
+        cfg.write_text(
+            "default_POTCAR_set = potpaw64\n"
+            "default_functional = GGA\n"
+            f"pyiron_vasp_resources = {self.tmp_path}\n"
+            "vasp_POTCAR_path_potpaw64 = {pyiron_vasp_resources}/potpaw_64\n"
+            "vasp_POTCAR_path_potpaw54 = {pyiron_vasp_resources}/potpaw_54\n"
+        )
+        return cfg
+
+
+class TestModuleImport(unittest.TestCase):
+    def test_defers_pymatgen_import(self) -> None:
+        """pymatgen and pyiron_vasp are only imported once a job needs them."""
+        code = (
+            "import sys, pyiron_workflow_vasp.vasp; "
+            "print(sorted(m for m in ('pymatgen', 'pyiron_vasp') if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(out.stdout.strip(), "[]")
+
+
+class TestReadPotcarConfig(_VaspTestCase):
+    def test_skips_comments_and_blank_lines(self) -> None:
+        cfg_file = self.tmp_path / "commented.cfg"
+        cfg_file.write_text(
+            "# POTCAR settings\n"
+            "\n"
+            "   # default_POTCAR_set = potpaw54\n"
+            "  default_POTCAR_set   =  potpaw64  \n"
+            "default_functional=GGA\n"
+            "a line without an equals sign\n"
+            "pyiron_vasp_resources = /tmp\n"
+            "vasp_POTCAR_path_potpaw64 = {pyiron_vasp_resources}/potpaw_64\n"
+            "note = a=b\n"
+        )
+
+        cfg = vasp.read_potcar_config(cfg_file)
+
+        self.assertEqual(cfg["default_POTCAR_set"], "potpaw64")
+        self.assertEqual(cfg["default_functional"], "GGA")
+        self.assertEqual(cfg["note"], "a=b")
+        self.assertNotIn("a line without an equals sign", cfg)
+
+    def test_rereads_modified_file(self) -> None:
+        config_file = self.write_config()
+
+        first = vasp.read_potcar_config(config_file)
+        first["default_functional"] = "mutated by caller"
+        self.assertEqual(
+            vasp.read_potcar_config(config_file)["default_functional"], "GGA"
+        )
+
+        config_file.write_text(
+            config_file.read_text().replace(
+                "default_functional = GGA", "default_functional = LDA"
+            )
+        )
+        st = os.stat(config_file)
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(
+            vasp.read_potcar_config(config_file)["default_functional"], "LDA"
+        )
+
+
+class TestDefaultPotcarPaths(_VaspTestCase):
+    def test_uses_default_rows(self) -> None:
+        potcar_df = pd.DataFrame(
+            {
+                "potential_name": ["Fe", "Fe_pv", "O_h", "O", "O_s"],
+                "symbol": ["Fe", "Fe", "O", "O", "O"],
+                "default": [False, True, False, True, True],
+            }
+        )
+        atoms = Atoms(symbols=["Fe", "Fe", "O", "Fe"])
+
+        paths = vasp.get_default_POTCAR_paths(
+            atoms,
+            pseudopot_lib_path="/lib",
+            pseudopot_functional="GGA",
+            potcar_df=potcar_df,
+        )
+        self.assertEqual(
+            paths,
+            ["/lib/GGA/Fe_pv/POTCAR", "/lib/GGA/O/POTCAR", "/lib/GGA/Fe_pv/POTCAR"],
+        )
+
+    def test_caches_packaged_table(self) -> None:
+        with mock.patch.object(vasp, "DEFAULT_CONFIG_PATH", self.write_config()):
+            atoms = Atoms(symbols=["Fe", "O", "O"])
+            first = vasp.get_default_POTCAR_paths(atoms, pseudopot_lib_path="/lib")
+            first.append("mutated by the caller")
+            second = vasp.get_default_POTCAR_paths(atoms, pseudopot_lib_path="/lib")
+
+            self.assertEqual(second, ["/lib/GGA/Fe/POTCAR", "/lib/GGA/O/POTCAR"])
+            self.assertEqual(vasp._resolve_potcar_paths.cache_info().hits, 1)
+
+            # A different species sequence reuses the already-loaded table
+            vasp._load_default_potcar_names.cache_clear()
+            vasp.get_default_POTCAR_paths(Atoms("H"), pseudopot_lib_path="/lib")
+            vasp.get_default_POTCAR_paths(Atoms("He"), pseudopot_lib_path="/lib")
+            self.assertEqual(vasp._load_default_potcar_names.cache_info().misses, 1)
+
+
+class TestWritePotcar(_VaspTestCase):
+    def test_concatenates_in_order(self) -> None:
+        sources = []
+        for element, size in (("Fe", 3_000_000), ("O", 0), ("H", 777)):
+            src = self.tmp_path / f"{element}_POTCAR"
+            src.write_bytes(element.encode() * size)
+            sources.append(str(src))
+        sources.append(sources[0])
+
+        vi = vasp.VaspInput(structure=Atoms("FeOHFe"), incar=None, potcar_paths=sources)
+        potcar = vasp.write_POTCAR(workdir=str(self.tmp_path), vasp_input=vi)
+
+        expected = b"".join(Path(src).read_bytes() for src in sources)
+        self.assertEqual(Path(potcar).read_bytes(), expected)
+
+    def test_empty_and_missing_sources(self) -> None:
+        empty = self.tmp_path / "empty_POTCAR"
+        empty.write_bytes(b"")
+        vi = vasp.VaspInput(structure=Atoms("H"), incar=None, potcar_paths=[str(empty)])
+        potcar = vasp.write_POTCAR(workdir=str(self.tmp_path), vasp_input=vi)
+        self.assertEqual(Path(potcar).read_bytes(), b"")
+
+        vi.potcar_paths = [str(empty), str(self.tmp_path / "missing")]
+        with self.assertRaises(FileNotFoundError):
+            vasp.write_POTCAR(workdir=str(self.tmp_path), vasp_input=vi)
+
+
+class TestWriteInputs(_VaspTestCase):
+    def test_input_set_writes_all_files(self) -> None:
+        potcar = self.tmp_path / "Fe_POTCAR"
+        potcar.write_text("Fe potential\n")
+        workdir = self.tmp_path / "calc"
+        workdir.mkdir()
+
+        vi = vasp.VaspInput(
+            structure=bulk("Fe", cubic=True, a=2.83),
+            incar=Incar.from_dict({"ENCUT": 400}),
+            potcar_paths=[str(potcar)],
+            kpoints=Kpoints.gamma_automatic((2, 2, 2)),
+        )
+        vasp.write_VaspInputSet.node_function(workdir=str(workdir), vasp_input=vi)
+
+        self.assertEqual(
+            sorted(p.name for p in workdir.iterdir()),
+            ["INCAR", "KPOINTS", "POSCAR", "POTCAR"],
+        )
+        self.assertEqual((workdir / "POTCAR").read_text(), "Fe potential\n")
+        self.assertEqual(Incar.from_file(workdir / "INCAR")["ENCUT"], 400)
+        self.assertIn("Fe", (workdir / "POSCAR").read_text())
+
+        vi.potcar_paths = [str(self.tmp_path / "missing")]
+        with self.assertRaises(FileNotFoundError):
+            vasp.write_VaspInputSet.node_function(workdir=str(workdir), vasp_input=vi)
+
+    def test_kpoints_default_and_explicit(self) -> None:
+        default = vasp.write_KPOINTS(workdir=str(self.tmp_path))
+        self.assertEqual(
+            Path(default).read_text(), "Automatic mesh\n0\nGamma\n1 1 1\n0 0 0\n"
+        )
+
+        kpoints = Kpoints.gamma_automatic((3, 3, 1))
+        explicit = vasp.write_KPOINTS(
+            workdir=str(self.tmp_path), kpoints=kpoints, filename="KPOINTS.mesh"
+        )
+        self.assertEqual(Kpoints.from_file(explicit).kpts, kpoints.kpts)
+
+    def test_construct_sequential_input_uses_final_structure(self) -> None:
+        initial = AseAtomsAdaptor.get_structure(bulk("Fe", cubic=True, a=2.83))
+        final = AseAtomsAdaptor.get_structure(bulk("Fe", cubic=True, a=2.85))
+        vasp_output = SimpleNamespace(
+            structures=pd.Series([[initial.to_json(), final.to_json()]])
+        )
+
+        construct = (
+            vasp.construct_sequential_VaspInput_from_vaspoutput_structure.node_function
+        )
+        first = construct(vasp_output, incar=None, potcar_paths=["/dev/null"])
+        first.structure.positions += 1.0
+        second = construct(vasp_output, incar=None, potcar_paths=["/dev/null"])
+
+        self.assertAlmostEqual(second.structure.cell[0, 0], 2.85)
+        np.testing.assert_allclose(second.structure.positions[0], [0.0, 0.0, 0.0])
+        self.assertIsNot(second.structure, first.structure)
+
+    def test_create_working_directory_warns_only_when_it_exists(self) -> None:
+        create = vasp.create_WorkingDirectory.node_function
+        workdir = self.tmp_path / "a" / "b"
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(create(str(workdir)), str(workdir))
+        self.assertTrue(workdir.is_dir())
+
+        with self.assertWarnsRegex(UserWarning, "already exists"):
+            create(str(workdir))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            create(str(workdir), quiet=True)
+
+        (self.tmp_path / "file").write_text("x")
+        with self.assertRaises(FileExistsError):
+            create(str(self.tmp_path / "file"))
+
+
+class TestOutputChecks(_VaspTestCase):
+    def test_check_convergence_from_log_without_vasprun(self) -> None:
+        check = vasp.check_convergence.node_function
+        self.assertFalse(check(workdir=str(self.tmp_path)))
+
+        (self.tmp_path / "error.out").write_text(
+            "...\n reached required accuracy - stopping structural energy "
+            "minimisation\n"
+        )
+        self.assertTrue(check(workdir=str(self.tmp_path)))
+
+    def test_log_contains_checks_tail_then_whole_file(self) -> None:
+        log = self.tmp_path / "vasp.log"
+        log.write_text("marker\n" + "x" * 100 + "\ntail end\n")
+
+        self.assertTrue(vasp._log_contains(str(log), "tail end", tail_bytes=16))
+        self.assertTrue(vasp._log_contains(str(log), "marker", tail_bytes=16))
+        self.assertFalse(vasp._log_contains(str(log), "absent", tail_bytes=16))
+
+    def test_parse_output_reuses_cache_until_outputs_change(self) -> None:
+        calls = []
+
+        def fake_parser(working_directory):
+            calls.append(working_directory)
+            return {"energy": -1.0 * len(calls)}
+
+        parse = vasp.parse_VaspOutput.node_function
+        workdir = str(self.tmp_path)
+        vasprun = self.tmp_path / "vasprun.xml"
+        vasprun.write_text("<modeling/>")
+
+        with mock.patch.object(
+            pyiron_vasp.vasp.output, "parse_vasp_output", fake_parser
+        ):
+            # Off by default: nothing is written or read back
+            self.assertEqual(parse(workdir), {"energy": -1.0})
+            self.assertFalse((self.tmp_path / ".parsed_output.pkl").exists())
+            calls.clear()
+
+            self.assertEqual(parse(workdir, cache_parsed_output=True), {"energy": -1.0})
+            self.assertEqual(parse(workdir, cache_parsed_output=True), {"energy": -1.0})
+            self.assertEqual(len(calls), 1)
+            self.assertTrue((self.tmp_path / ".parsed_output.pkl").is_file())
+            self.assertEqual(parse(workdir), {"energy": -2.0})
+
+            vasprun.write_text("<modeling>rerun</modeling>")
+            os.utime(vasprun, ns=(1, 1))
+            self.assertEqual(parse(workdir, cache_parsed_output=True), {"energy": -3.0})
+
+            contcar = self.tmp_path / "CONTCAR"
+            contcar.write_text("relaxed structure")
+            self.assertEqual(parse(workdir, cache_parsed_output=True), {"energy": -4.0})
+            self.assertEqual(parse(workdir, cache_parsed_output=True), {"energy": -4.0})
+
+            # Custom parsers are never cached
+            custom = parse(
+                workdir, function=lambda: {"custom": True}, cache_parsed_output=True
+            )
+            self.assertEqual(custom, {"custom": True})
+            self.assertEqual(len(calls), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()